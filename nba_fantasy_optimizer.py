@@ -1,7 +1,20 @@
 import pulp
 import pandas as pd
+import numpy as np
 import requests
 import json
+import os
+import pickle
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _dot(coefficients, variables):
+    # Single-pass dot product of a coefficient vector and a variable
+    # sequence. pulp.lpDot builds one expression per term and chains them
+    # with __add__, copying dicts along the way; constructing from
+    # (variable, coefficient) pairs walks both sequences once.
+    return pulp.LpAffineExpression(zip(variables, coefficients))
 
 
 class NBAFantasyOptimizer:
@@ -16,6 +29,7 @@ class NBAFantasyOptimizer:
         self.games_df = games_df
         self.config = config
         self.prob = pulp.LpProblem("NBAFantasy", pulp.LpMaximize)
+        self.model_built = False
 
     def setup_problem(self):
         self.budget = self.config["budget"]
@@ -27,56 +41,190 @@ class NBAFantasyOptimizer:
         if "player_points_adjustments" in self.config:
             self.adjust_player_points()
 
-        self.initialize_variables()
-        self.add_constraints()
+        # Materialize the player columns used in hot loops as NumPy arrays so
+        # coefficient lookups are plain array indexing instead of pandas
+        # label indexing
+        self._cost = self.players_df["now_cost"].to_numpy()
+        self._ppg = self.players_df["points_per_game"].to_numpy(dtype=np.float64)
+        self._team = self.players_df["team"].to_numpy()
+        self._type = self.players_df["element_type"].to_numpy()
+
+        # Cache player index arrays per type and per team so the constraint
+        # loops don't re-filter the DataFrame on every day
+        self.idx_by_type = {
+            k: self.players_df.index[self._type == k].to_numpy() for k in (1, 2)
+        }
+        self.idx_by_team = {
+            t: self.players_df.index[self._team == t].to_numpy()
+            for t in np.unique(self._team)
+        }
+
+        self.compute_points_matrix()
+
+        # Variables and constraints don't depend on player points, so the
+        # model is built once; calling setup_problem again with new
+        # player_points_adjustments only swaps the objective coefficients
+        # and the point-ranked captain constraints
+        if not self.model_built:
+            self.build_model()
         self.set_objective_function()
+        self.add_captain_symmetry_constraints()
 
-        # Solve
-        self.prob.solve()
+        # Solve, warm-starting from the previous run's squad if one was saved
+        self.warm_start = self.load_warm_start()
+        self.prob.solve(self.create_solver())
+        self.save_warm_start()
         self.print_solution()
 
+    def build_model(self):
+        self.initialize_variables()
+        self.add_constraints()
+        self.model_built = True
+
+    def load_warm_start(self):
+        # Seed the squad variables with the solution of a previous run. On
+        # re-runs with tweaked player points the solver then starts from a
+        # near-optimal incumbent instead of from scratch.
+        path = self.config.get("warm_start_file", "warm_start.pkl")
+        if not os.path.exists(path):
+            return False
+
+        with open(path, "rb") as file:
+            values = pickle.load(file)
+
+        for key, value in values.items():
+            if key in self.squad_day:
+                self.squad_day[key].setInitialValue(value)
+        return True
+
+    def save_warm_start(self):
+        if self.prob.status != pulp.LpStatusOptimal:
+            return
+
+        path = self.config.get("warm_start_file", "warm_start.pkl")
+        values = {
+            key: var.varValue
+            for key, var in self.squad_day.items()
+            if var.varValue is not None
+        }
+        with open(path, "wb") as file:
+            pickle.dump(values, file)
+
+    def create_solver(self):
+        # Build the solver selected in the configuration, defaulting to
+        # multi-threaded CBC. Time limit and relative gap let the user accept
+        # near-optimal solutions early on long horizons.
+        solver_name = self.config.get("solver", "CBC")
+        options = {
+            "msg": False,
+            "threads": self.config.get("threads", os.cpu_count()),
+            "timeLimit": self.config.get("time_limit"),
+            "gapRel": self.config.get("gap_rel"),
+            "warmStart": self.warm_start,
+        }
+        # HiGHS and Gurobi use their in-memory python bindings: the _CMD
+        # variants write an LP file and parse a result file through a
+        # subprocess, an O(model size) disk round-trip per solve
+        if solver_name == "HIGHS":
+            return pulp.HiGHS(**options)
+        if solver_name == "GUROBI":
+            return pulp.GUROBI(**options)
+        return pulp.PULP_CBC_CMD(presolve=True, cuts=True, **options)
+
+    def compute_points_matrix(self):
+        # Precompute the points each player would score on each day: their
+        # points per game if their team plays that day, zero otherwise. Doing
+        # this once avoids scanning games_df for every (player, day) pair.
+        # One pass over the horizon's games gives the set of teams playing
+        # on each day; checking whether a team plays is then O(1)
+        horizon = self.games_df[self.games_df["event"].isin(self.days)]
+        self._teams_by_day = {
+            d: set(group[["team_h", "team_a"]].to_numpy().ravel())
+            for d, group in horizon.groupby("event")
+        }
+
+        self.plays = np.zeros((len(self.players_df), len(self.days)), dtype=bool)
+        for col, d in enumerate(self.days):
+            playing_teams = self._teams_by_day.get(d, set())
+            self.plays[:, col] = np.isin(self._team, list(playing_teams))
+        self.points = np.where(self.plays, self._ppg[:, None], 0.0)
+
     def initialize_variables(self):
+        # Every player keeps their full variable set: non-playing squad
+        # members are legitimate zero-point fill-ins for the daily line-up,
+        # so only their objective terms may be skipped, never the variables
+        # or the reach of the line-up equalities
+        pairs = [(i, d) for i in self.players_df.index for d in self.days]
+
+        # The dicts are built directly instead of through LpVariable.dicts,
+        # whose generic recursive machinery formats a long name per key; the
+        # short names also shrink the LP file handed to the solver
+
         # Binary variable that records whether a player is in the initial squad
-        self.initial_squad = pulp.LpVariable.dicts(
-            "initial_squad", [i for i in self.players_df.index], cat="Binary"
-        )
-        # Binary variable that records whether a player is in the squad on day d
-        self.squad_day = pulp.LpVariable.dicts(
-            "squad_day",
-            [(i, d) for i in self.players_df.index for d in self.days],
-            cat="Binary",
-        )
+        self.initial_squad = {
+            i: pulp.LpVariable(f"is_{i}", cat="Binary") for i in self.players_df.index
+        }
+        if self.config.get("transfers", 0) > 0:
+            # Binary variable that records whether a player is in the squad
+            # on day d
+            self.squad_day = {
+                (i, d): pulp.LpVariable(f"sd_{i}_{d}", cat="Binary")
+                for i, d in pairs
+            }
+            # Variable that records whether a player is transferred in on
+            # day d. Declared continuous in [0, 1]: the consistency
+            # constraints bound it by differences of binaries, so it is
+            # integral in any optimal solution and the solver has far fewer
+            # integer variables to branch on
+            self.t_in = {
+                (i, d): pulp.LpVariable(f"ti_{i}_{d}", lowBound=0, upBound=1)
+                for i, d in pairs
+            }
+            # Variable that records whether a player is transferred out on day d
+            self.t_out = {
+                (i, d): pulp.LpVariable(f"to_{i}_{d}", lowBound=0, upBound=1)
+                for i, d in pairs
+            }
+        else:
+            # Without transfers the squad cannot change, so every day shares
+            # the initial squad variables and the per-day squad copies plus
+            # all transfer variables disappear from the problem
+            self.squad_day = {(i, d): self.initial_squad[i] for i, d in pairs}
+            self.t_in = {}
+            self.t_out = {}
+
         # Binary variable that records whether a player is in the line-up on day d
-        self.chosen_day = pulp.LpVariable.dicts(
-            "player_day",
-            [(i, d) for i in self.players_df.index for d in self.days],
-            cat="Binary",
-        )
-        # Binary variable that records whether a player is transferred in on day d
-        self.t_in = pulp.LpVariable.dicts(
-            "transfer_in",
-            [(i, d) for i in self.players_df.index for d in self.days],
-            cat="Binary",
-        )
-        # Binary variable that records whether a player is transferred out on day d
-        self.t_out = pulp.LpVariable.dicts(
-            "transfer_out",
-            [(i, d) for i in self.players_df.index for d in self.days],
-            cat="Binary",
-        )
-        # Binary variable that records which player is selected as captain
-        self.doubled_score = pulp.LpVariable.dicts(
-            "captain_selected",
-            [(i, d) for i in self.players_df.index for d in self.days],
-            cat="Binary",
-        )
+        self.chosen_day = {
+            (i, d): pulp.LpVariable(f"cd_{i}_{d}", cat="Binary") for i, d in pairs
+        }
+        # Continuous helper variables for the captain symmetry constraints,
+        # one per (day, rank). Created once so re-solves can rebuild the
+        # ranking constraints without leaving orphaned variables behind
+        self.prefix = {
+            (d, rank): pulp.LpVariable(f"pfx_{d}_{rank}", lowBound=0)
+            for col, d in enumerate(self.days)
+            for rank in range(int(self.plays[:, col].sum()))
+        }
+        # Binary variable that records which player is selected as captain.
+        # Created for every pair so points adjusted upward on a cached model
+        # always find their variable; zero-point captains only drop out of
+        # the objective
+        self.doubled_score = {
+            (i, d): pulp.LpVariable(f"cap_{i}_{d}", cat="Binary") for i, d in pairs
+        }
 
     def adjust_player_points(self):
+        # Resolve player names through a dict instead of scanning the name
+        # column once per adjustment
+        name_to_idx = pd.Series(
+            self.players_df.index, index=self.players_df["name"]
+        ).to_dict()
+        col_ppg = self.players_df.columns.get_loc("points_per_game")
+
         for player_name, points in self.config["player_points_adjustments"].items():
-            if player_name in self.players_df["name"].values:
-                self.players_df.loc[
-                    self.players_df["name"] == player_name, "points_per_game"
-                ] = points
+            idx = name_to_idx.get(player_name)
+            if idx is not None:
+                self.players_df.iat[idx, col_ppg] = points
             else:
                 print(f"Warning: Player '{player_name}' not found in DataFrame.")
 
@@ -90,7 +238,9 @@ class NBAFantasyOptimizer:
     def add_initial_player_constraints(self):
         # 10 initial players for the week
         self.prob += (
-            pulp.lpSum(self.initial_squad[i] for i in self.players_df.index)
+            pulp.LpAffineExpression(
+                (self.initial_squad[i], 1) for i in self.players_df.index
+            )
             == self.INITIAL_PLAYERS_COUNT
         )
 
@@ -105,12 +255,7 @@ class NBAFantasyOptimizer:
     def add_budget_constraints(self):
         # Set initial squad budget constraint
         self.prob += (
-            pulp.lpSum(
-                [
-                    self.initial_squad[i] * self.players_df["now_cost"][i]
-                    for i in self.players_df.index
-                ]
-            )
+            _dot(self._cost, (self.initial_squad[i] for i in self.players_df.index))
             <= self.config["budget"],
             f"Inital Squad Budget",
         )
@@ -118,151 +263,223 @@ class NBAFantasyOptimizer:
         # Sets budget constraints for each day
         for d in self.days:
             self.prob += (
-                pulp.lpSum(
-                    [
-                        self.squad_day[i, d] * self.players_df["now_cost"][i]
-                        for i in self.players_df.index
-                    ]
+                _dot(
+                    self._cost,
+                    (self.squad_day[i, d] for i in self.players_df.index),
                 )
                 <= self.config["budget"],
                 f"Budget Day {d}",
             )
 
     def add_transfer_constraints(self):
+        # Without transfers the squad variables are shared across days and
+        # there is nothing to constrain
+        if not self.t_in:
+            return
+
         # Sets transfer limits and consistency constraints
         # Limit on transfers
-        self.prob += pulp.lpSum(self.t_in) <= self.config["transfers"]
-        self.prob += pulp.lpSum(self.t_out) <= self.config["transfers"]
+        self.prob += (
+            pulp.LpAffineExpression((v, 1) for v in self.t_in.values())
+            <= self.config["transfers"]
+        )
+        self.prob += (
+            pulp.LpAffineExpression((v, 1) for v in self.t_out.values())
+            <= self.config["transfers"]
+        )
 
-        # Transfer consistency
+        # Transfer consistency. The constraints are built directly from their
+        # coefficient lists: operator syntax like `t_in >= a - b` creates and
+        # copies two intermediate expressions per constraint, which adds up
+        # over players x days
         for i in self.players_df.index:
             for d in self.days:
                 if d == self.start_gameday:
                     # Compare with initial squad
-                    self.prob += (
-                        self.t_in[i, d] >= self.squad_day[i, d] - self.initial_squad[i],
-                        f"Transfer_In_Consistency_{i}_{d}",
-                    )
-                    self.prob += (
-                        self.t_out[i, d]
-                        >= self.initial_squad[i] - self.squad_day[i, d],
-                        f"Transfer_Out_Consistency_{i}_{d}",
-                    )
+                    prev_squad = self.initial_squad[i]
                 else:
-                    self.prob += (
-                        self.t_in[i, d]
-                        >= self.squad_day[i, d] - self.squad_day[i, d - 1],
-                        f"Transfer_In_Consistency_{i}_{d}",
-                    )
-                    self.prob += (
-                        self.t_out[i, d]
-                        >= self.squad_day[i, d - 1] - self.squad_day[i, d],
-                        f"Transfer_Out_Consistency_{i}_{d}",
-                    )
+                    prev_squad = self.squad_day[i, d - 1]
+
+                self.prob += pulp.LpConstraint(
+                    e=pulp.LpAffineExpression(
+                        [
+                            (self.t_in[i, d], 1),
+                            (self.squad_day[i, d], -1),
+                            (prev_squad, 1),
+                        ]
+                    ),
+                    sense=pulp.LpConstraintGE,
+                    rhs=0,
+                    name=f"Transfer_In_Consistency_{i}_{d}",
+                )
+                self.prob += pulp.LpConstraint(
+                    e=pulp.LpAffineExpression(
+                        [
+                            (self.t_out[i, d], 1),
+                            (self.squad_day[i, d], 1),
+                            (prev_squad, -1),
+                        ]
+                    ),
+                    sense=pulp.LpConstraintGE,
+                    rhs=0,
+                    name=f"Transfer_Out_Consistency_{i}_{d}",
+                )
 
     def add_daily_constraints(self):
-        # Sets constraints that apply to each day
-        for d in self.days:
-            # Constraints based on player types and total players chosen
-            self.prob += (
-                pulp.lpSum(
-                    [
-                        self.chosen_day[(i, d)]
-                        for i in self.players_df[
-                            self.players_df["element_type"] == 1
-                        ].index
-                    ]
-                )
-                >= self.MIN_PLAYER_TYPE_COUNT
+        # Each day's constraints reference disjoint variables, so they can be
+        # built in worker threads and merged into the problem serially. The
+        # short counter names sidestep PuLP's unused-name search that every
+        # anonymous constraint otherwise goes through on insertion
+        k = 0
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for constraints in executor.map(self.build_day_constraints, self.days):
+                for constraint in constraints:
+                    constraint.name = f"l{k}"
+                    k += 1
+                    self.prob += constraint
+
+    def build_day_constraints(self, d):
+        # Builds the constraints for a single day without touching self.prob
+        constraints = []
+
+        # Constraints based on player types and total players chosen
+        constraints.append(
+            pulp.LpAffineExpression(
+                (self.chosen_day[(i, d)], 1) for i in self.idx_by_type[1]
             )
-            self.prob += (
-                pulp.lpSum(
-                    [
-                        self.chosen_day[(i, d)]
-                        for i in self.players_df[
-                            self.players_df["element_type"] == 2
-                        ].index
-                    ]
-                )
-                >= self.MIN_PLAYER_TYPE_COUNT
+            >= self.MIN_PLAYER_TYPE_COUNT
+        )
+        constraints.append(
+            pulp.LpAffineExpression(
+                (self.chosen_day[(i, d)], 1) for i in self.idx_by_type[2]
             )
-            self.prob += (
-                pulp.lpSum([self.chosen_day[(i, d)] for i in self.players_df.index])
-                == self.TOTAL_PLAYERS_PER_DAY
+            >= self.MIN_PLAYER_TYPE_COUNT
+        )
+        constraints.append(
+            pulp.LpAffineExpression(
+                (self.chosen_day[(i, d)], 1) for i in self.players_df.index
             )
-            self.prob += (
-                pulp.lpSum([self.doubled_score[(i, d)] for i in self.players_df.index])
-                == 1
+            == self.TOTAL_PLAYERS_PER_DAY
+        )
+        constraints.append(
+            pulp.LpAffineExpression(
+                (self.doubled_score[(i, d)], 1) for i in self.players_df.index
             )
+            == 1
+        )
 
-            # Squad size constraints
-            self.prob += (
-                pulp.lpSum(
-                    [
-                        self.squad_day[(i, d)]
-                        for i in self.players_df[
-                            self.players_df["element_type"] == 1
-                        ].index
-                    ]
-                )
-                == self.PLAYER_TYPE_COUNT
+        # Squad size constraints
+        constraints.append(
+            pulp.LpAffineExpression(
+                (self.squad_day[(i, d)], 1) for i in self.idx_by_type[1]
             )
-            self.prob += (
-                pulp.lpSum(
-                    [
-                        self.squad_day[(i, d)]
-                        for i in self.players_df[
-                            self.players_df["element_type"] == 2
-                        ].index
-                    ]
-                )
-                == self.PLAYER_TYPE_COUNT
+            == self.PLAYER_TYPE_COUNT
+        )
+        constraints.append(
+            pulp.LpAffineExpression(
+                (self.squad_day[(i, d)], 1) for i in self.idx_by_type[2]
+            )
+            == self.PLAYER_TYPE_COUNT
+        )
+
+        for i in self.players_df.index:
+            # Players can't play on a day if they're not chosen for the week
+            constraints.append(self.chosen_day[(i, d)] <= self.squad_day[(i, d)])
+            constraints.append(self.doubled_score[(i, d)] <= self.chosen_day[(i, d)])
+
+        # Aggregated cut implied by the per-pair links above. It is
+        # redundant for the MIP but tightens what presolve can derive
+        # from the LP relaxation, trimming the branch-and-cut tree
+        constraints.append(
+            pulp.LpAffineExpression(
+                [(self.chosen_day[(i, d)], 1) for i in self.players_df.index]
+                + [(self.squad_day[(i, d)], -1) for i in self.players_df.index]
             )
+            <= 0
+        )
 
-            for i in self.players_df.index:
-                # Players can't play on a day if they're not chosen for the week
-                self.prob += self.chosen_day[(i, d)] <= self.squad_day[(i, d)]
-                self.prob += self.doubled_score[(i, d)] <= self.chosen_day[(i, d)]
+        return constraints
+
+    def add_captain_symmetry_constraints(self):
+        # Symmetry breaking for the captain choice: doubling the
+        # highest-scoring chosen player is always optimal, so force exactly
+        # that. The ranking depends on the (adjusted) player points, so
+        # unlike the rest of the model these constraints are replaced by
+        # name on every solve.
+        stale = [name for name in self.prob.constraints if name.startswith("sym_")]
+        for name in stale:
+            del self.prob.constraints[name]
+
+        for d in self.days:
+            for k, constraint in enumerate(self.build_captain_symmetry(d)):
+                self.prob.addConstraint(constraint, f"sym_{d}_{k}")
+
+    def build_captain_symmetry(self, d):
+        # prefix[r] records whether any of the r best-scoring eligible
+        # players is chosen on day d, and a player may not captain while
+        # someone ranked above them plays. Ties resolve to the lower rank,
+        # removing symmetric optima the solver would otherwise enumerate.
+        constraints = []
+        col = d - self.start_gameday
+        ranked = [
+            i
+            for i in np.argsort(-self.points[:, col], kind="stable")
+            if self.plays[i, col]
+        ]
+        prev_prefix = None
+        for rank, i in enumerate(ranked):
+            prefix = self.prefix[(d, rank)]
+            constraints.append(prefix >= self.chosen_day[(i, d)])
+            if prev_prefix is not None:
+                constraints.append(prefix >= prev_prefix)
+                constraints.append(self.doubled_score[(i, d)] + prev_prefix <= 1)
+            prev_prefix = prefix
+        return constraints
 
     def add_team_constraints(self):
-        # Two players from the same team constraint
-        for team in self.players_df["team"].unique():
-            for d in self.days:
-                self.prob += (
-                    pulp.lpSum(
-                        self.squad_day[i, d]
-                        for i in self.players_df[self.players_df["team"] == team].index
-                    )
-                    <= self.MAX_PLAYERS_FROM_SAME_TEAM
+        # Two players from the same team constraint, built per day in
+        # worker threads like the daily constraints and named by counter
+        k = 0
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for constraints in executor.map(self.build_team_constraints, self.days):
+                for constraint in constraints:
+                    constraint.name = f"t{k}"
+                    k += 1
+                    self.prob += constraint
+
+    def build_team_constraints(self, d):
+        constraints = []
+        for team in self.idx_by_team:
+            constraints.append(
+                pulp.LpAffineExpression(
+                    (self.squad_day[i, d], 1) for i in self.idx_by_team[team]
                 )
+                <= self.MAX_PLAYERS_FROM_SAME_TEAM
+            )
+        return constraints
 
     def set_objective_function(self):
-        # Define the function that calculates player points for a day
-        def player_points_for_day(player_idx, day):
-            team = self.players_df["team"][player_idx]
-            games_on_day = self.games_df[self.games_df["event"] == day]
-
-            if (
-                team in games_on_day["team_h"].values
-                or team in games_on_day["team_a"].values
-            ):
-                return self.players_df["points_per_game"].astype(float)[player_idx]
-            return 0
-
-        # Set the objective function
-        self.prob += pulp.lpSum(
-            player_points_for_day(i, d)
-            * (self.chosen_day[(i, d)] + self.doubled_score[(i, d)])
-            for i in self.players_df.index
-            for d in self.days
-        )
+        # Set the objective function from the precomputed points matrix,
+        # skipping zero-coefficient terms to keep the LP small
+        terms = []
+        for col, d in enumerate(self.days):
+            for i in np.nonzero(self.points[:, col])[0]:
+                points = self.points[i, col]
+                terms.append((self.chosen_day[(i, d)], points))
+                terms.append((self.doubled_score[(i, d)], points))
+        # Assigned directly so re-solves swap the coefficients in place
+        # without rebuilding anything else
+        self.prob.objective = pulp.LpAffineExpression(terms)
 
     def print_initial_squad(self):
         print("Initial Squad:")
-        for player_idx in self.players_df.index:
-            if self.initial_squad[player_idx].varValue == 1:
-                player_name = self.players_df.loc[player_idx, "name"]
-                print(f"  - {player_name}")
+        names = self.players_df["name"].to_numpy()
+        values = np.fromiter(
+            (self.initial_squad[i].varValue or 0 for i in self.players_df.index),
+            dtype=np.float64,
+        )
+        for i in np.nonzero(values > 0.5)[0]:
+            print(f"  - {names[i]}")
 
     def print_solution(self):
         if self.prob.status != pulp.LpStatusOptimal:
@@ -272,33 +489,65 @@ class NBAFantasyOptimizer:
         # Print the value of the objective function
         print(f"Total Points: {pulp.value(self.prob.objective)}")
 
-        # Print the transfers to be made
+        if not self.t_in:
+            return
+
+        # Print the transfers to be made. Variable values are pulled into
+        # arrays once instead of calling pulp.value per (player, day) pair
         print("\nTransfers to be made:")
-        for d in self.days:
-            transfers_in = [
-                (i, d)
+        names = self.players_df["name"].to_numpy()
+        t_in_values = np.array(
+            [
+                [self.t_in[i, d].varValue or 0 for d in self.days]
                 for i in self.players_df.index
-                if pulp.value(self.t_in[i, d]) == 1
             ]
-            transfers_out = [
-                (i, d)
+        )
+        t_out_values = np.array(
+            [
+                [self.t_out[i, d].varValue or 0 for d in self.days]
                 for i in self.players_df.index
-                if pulp.value(self.t_out[i, d]) == 1
             ]
+        )
 
-            if transfers_in or transfers_out:
+        for col, d in enumerate(self.days):
+            transfers_in = np.nonzero(t_in_values[:, col] > 0.5)[0]
+            transfers_out = np.nonzero(t_out_values[:, col] > 0.5)[0]
+
+            if transfers_in.size or transfers_out.size:
                 print(f"\nDay {d}:")
-                if transfers_in:
+                if transfers_in.size:
                     print("  Transfers In:")
-                    for i, day in transfers_in:
-                        player_name = self.players_df.loc[i, "name"]
-                        print(f"    - {player_name}")
+                    for row in transfers_in:
+                        print(f"    - {names[row]}")
 
-                if transfers_out:
+                if transfers_out.size:
                     print("  Transfers Out:")
-                    for i, day in transfers_out:
-                        player_name = self.players_df.loc[i, "name"]
-                        print(f"    - {player_name}")
+                    for row in transfers_out:
+                        print(f"    - {names[row]}")
+
+
+def load_dataframes():
+    # The pyarrow engine parses the CSVs multi-threaded when it is
+    # installed; the explicit dtypes keep the columns the optimizer scans
+    # as compact native integers rather than inferred 64-bit ones
+    engine = "pyarrow" if importlib.util.find_spec("pyarrow") else "c"
+
+    players_df = pd.read_csv(
+        "players.csv",
+        engine=engine,
+        dtype={
+            "team": "int16",
+            "element_type": "int8",
+            "now_cost": "int32",
+            "points_per_game": "float64",
+        },
+    )
+    games_df = pd.read_csv(
+        "games.csv",
+        engine=engine,
+        dtype={"event": "int32", "team_h": "int16", "team_a": "int16"},
+    )
+    return players_df, games_df
 
 
 def main():
@@ -306,11 +555,8 @@ def main():
     with open("config.json", "r") as file:
         config = json.load(file)
 
-    # Read players dataframe
-    players_df = pd.read_csv("players.csv")
-
-    # Read games dataframe
-    games_df = pd.read_csv("games.csv")
+    # Read players and games dataframes
+    players_df, games_df = load_dataframes()
 
     # Create optimizer object and run solver
     optimizer = NBAFantasyOptimizer(players_df, games_df, config)